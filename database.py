@@ -1,4 +1,23 @@
+import bisect
 import math
+import operator
+from array import array
+from collections import defaultdict
+from itertools import chain, compress, repeat
+from operator import attrgetter
+
+
+COLUMN_FILTERS = {
+    'distance_min': ('_ap_distance', '>='),
+    'distance_max': ('_ap_distance', '<='),
+    'velocity_min': ('_ap_velocity', '>='),
+    'velocity_max': ('_ap_velocity', '<='),
+    'diameter_min': ('_ap_diameter', '>='),
+    'diameter_max': ('_ap_diameter', '<='),
+    'hazardous': ('_ap_hazardous', '=='),
+}
+
+OPERATORS = {'>=': operator.ge, '<=': operator.le, '==': operator.eq}
 
 
 class NEODatabase:
@@ -32,22 +51,56 @@ class NEODatabase:
         :param approaches: A collection of `CloseApproach`es.
         """
         self.neos_by_designation = {}
-        for n in neos:
-            self.neos_by_designation[n.designation] = n
         self.neos_by_name = {}
         for n in neos:
-            self.neos_by_name[n.name] = n
-        self.approaches = {}
+            self.neos_by_designation[n.designation] = n
+            if n.name:
+                self.neos_by_name[n.name] = n
+        grouped = defaultdict(list)
         for a in approaches:
-            if a.designation not in self.approaches:
-                self.approaches[a.designation] = [a]
-            else:
-                self.approaches[a.designation].append(a)
-        for n in self.neos_by_designation.values():
-            if n.designation in self.approaches:
-                n.approaches = self.approaches[n.designation]
-                for a in self.approaches[n.designation]:
+            grouped[a.designation].append(a)
+        self.approaches = dict(grouped)
+        for designation, ls in self.approaches.items():
+            n = self.neos_by_designation.get(designation)
+            if n is not None:
+                n.approaches = ls
+                for a in ls:
                     a.neo = n
+        self._build_columns(chain.from_iterable(self.approaches.values()))
+
+    def _build_columns(self, approaches):
+        """Store the close approaches column-wise, ordered by time.
+
+        Each `_ap_*` column holds one attribute per approach, aligned with
+        `_ap_objs`, so that `query` can filter whole columns at once. Every
+        column is a typed `array`, so `query` can scan a range of rows through
+        a `memoryview` without copying it; hazard flags are stored as 1 or 0,
+        or -1 for an approach without an NEO, which matches neither. Because
+        the rows are ordered by time, any date filter selects a contiguous
+        slice, located by bisecting the `_ap_date` column of day ordinals.
+        Approaches without a time come first, with a day ordinal of 0.
+
+        Each column is filled from a list rather than a generator, because an
+        `array` is only allocated at its final size when its length is known
+        up front.
+
+        :param approaches: A collection of linked `CloseApproach`es.
+        """
+        nan = math.nan
+        approaches = list(approaches)
+        undated = [a for a in approaches if a.time is None]
+        dated = [a for a in approaches if a.time is not None]
+        dated.sort(key=attrgetter('time'))
+        self._ap_objs = objs = undated + dated
+        self._ap_date = array('l', [0 if a.ordinal is None else a.ordinal
+                                    for a in objs])
+        self._ap_distance = array('d', [a.distance for a in objs])
+        self._ap_velocity = array('d', [a.velocity for a in objs])
+        neos = [a.neo for a in objs]
+        self._ap_diameter = array('d', [nan if n is None else n.diameter
+                                        for n in neos])
+        self._ap_hazardous = array('b', [-1 if n is None else n.hazardous
+                                         for n in neos])
 
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
@@ -63,9 +116,7 @@ class NEODatabase:
         :return: The `NearEarthObject` with the desired primary
         designation, or `None`.
         """
-        if designation not in self.neos_by_designation:
-            return None
-        return self.neos_by_designation[designation]
+        return self.neos_by_designation.get(designation)
 
     def get_neo_by_name(self, name):
         """Find and return an NEO by its name.
@@ -81,9 +132,7 @@ class NEODatabase:
         :param name: The name, as a string, of the NEO to search for.
         :return: The `NearEarthObject` with the desired name, or `None`.
         """
-        if name not in self.neos_by_name:
-            return None
-        return self.neos_by_name[name]
+        return self.neos_by_name.get(name)
 
     def query(self, filters=()):
         """Query close approaches to generate those that match.
@@ -96,43 +145,78 @@ class NEODatabase:
 
         If no arguments are provided, generate all known close approaches.
 
-        The `CloseApproach` objects are generated in
-        internal order, which isn't
-        guaranteed to be sorted meaninfully, although is often sorted by time.
+        The `CloseApproach` objects are generated in order of their
+        approach time.
 
         :param filters: A collection of filters capturing
         user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
-        for ls in self.approaches.values():
-            for a in ls:
-                invalid = False
-                if len(filters) != 0:
-                    for k, v in filters.items():
-                        if k == 'date' and a.time.date() != v:
-                            invalid = True
-                        if k == 'start_date' and a.time.date() < v:
-                            invalid = True
-                        if k == 'end_date' and a.time.date() > v:
-                            invalid = True
-                        if k == 'distance_min' and a.distance < v:
-                            invalid = True
-                        if k == 'distance_max' and a.distance > v:
-                            invalid = True
-                        if k == 'velocity_min' and a.velocity < v:
-                            invalid = True
-                        if k == 'velocity_max' and a.velocity > v:
-                            invalid = True
-                        if k in ('diameter_min', 'diameter_max') and \
-                                math.isnan(a.neo.diameter):
-                            invalid = True
-                        if k == 'diameter_min' and a.neo.diameter < v:
-                            invalid = True
-                        if k == 'diameter_max' and a.neo.diameter > v:
-                            invalid = True
-                        if k == 'hazardous' and a.neo.hazardous != v:
-                            invalid = True
-                        if invalid:
-                            break
-                if not invalid:
-                    yield a
+        filters = {k: v for k, v in dict(filters).items() if v is not None}
+        lo, hi = self._date_slice(filters)
+        terms = [(*COLUMN_FILTERS[k], v) for k, v in filters.items()
+                 if k in COLUMN_FILTERS]
+        if not terms:
+            mask = None
+        elif len(terms) == 1:
+            column, symbol, v = terms[0]
+            values = memoryview(getattr(self, column))[lo:hi]
+            mask = map(OPERATORS[symbol], values, repeat(v))
+        else:
+            columns, match = _compile_terms(terms)
+            mask = map(match, *(memoryview(getattr(self, column))[lo:hi]
+                                for column in columns))
+        rows = self._ap_objs[lo:hi]
+        yield from rows if mask is None else compress(rows, mask)
+
+    def _date_slice(self, filters):
+        """Return the bounds of the rows that satisfy every date filter.
+
+        The `date`, `start_date` and `end_date` filters are folded into a
+        single inclusive range, which is located in the `_ap_date` column by
+        bisection. Approaches without a time never satisfy a date filter.
+
+        :param filters: A mapping of filter names to reference values.
+        :return: A `(lo, hi)` pair of row indices.
+        """
+        start = filters.get('start_date')
+        end = filters.get('end_date')
+        if 'date' in filters:
+            date = filters['date']
+            start = date if start is None else max(start, date)
+            end = date if end is None else min(end, date)
+        if start is None and end is None:
+            return 0, len(self._ap_date)
+        # Approaches without a time have ordinal 0, below every real date.
+        lo = bisect.bisect_left(self._ap_date,
+                                1 if start is None else start.toordinal())
+        hi = len(self._ap_date) if end is None\
+            else bisect.bisect_right(self._ap_date, end.toordinal())
+        return lo, hi
+
+
+def _compile_terms(terms):
+    """Generate a single predicate function for several column filters.
+
+    The generated function takes one value from each distinct column and
+    tests every term with a short-circuiting `and`, binding the reference
+    values as default arguments. For example, the terms
+    `[('_ap_distance', '<=', 0.1), ('_ap_velocity', '>=', 30)]` produce::
+
+        def match(c0, c1, v0=v0, v1=v1):
+            return c0 <= v0 and c1 >= v1
+
+    :param terms: A list of `(column, symbol, value)` triples.
+    :return: A tuple of the column names, in argument order, and the
+    generated function.
+    """
+    columns = list(dict.fromkeys(column for column, _, _ in terms))
+    values = {f'v{i}': v for i, (_, _, v) in enumerate(terms)}
+    params = [f'c{i}' for i in range(len(columns))]
+    params += [f'{name}={name}' for name in values]
+    test = ' and '.join(f'c{columns.index(column)} {symbol} v{i}'
+                        for i, (column, symbol, _) in enumerate(terms))
+    source = f'def match({", ".join(params)}):\n    return {test}\n'
+    namespace = dict(values)
+    exec(source, namespace)
+    return columns, namespace['match']
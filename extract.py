@@ -1,5 +1,16 @@
 import csv
 import json
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 from models import NearEarthObject, CloseApproach
@@ -12,22 +23,21 @@ def load_neos(neo_csv_path):
     about near-Earth objects.
     :return: A collection of `NearEarthObject`s.
     """
-    res = []
     with open(neo_csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            designation = row['pdes']
-            name = row['name']
-            diameter = row['diameter']
-            hazardous = True if row['pha'] == 'Y' else False
-            neo = NearEarthObject(
+        reader = csv.reader(f)
+        header = next(reader)
+        columns = itemgetter(*(header.index(field) for field in
+                               ('pdes', 'name', 'diameter', 'pha')))
+        rows = map(columns, filter(None, reader))
+        return tuple(
+            NearEarthObject(
                 designation=designation,
                 name=name,
                 diameter=diameter,
-                hazardous=hazardous
+                hazardous=pha == 'Y'
             )
-            res.append(neo)
-    return tuple(res)
+            for designation, name, diameter, pha in rows
+        )
 
 
 def load_approaches(cad_json_path):
@@ -37,19 +47,37 @@ def load_approaches(cad_json_path):
     about close approaches.
     :return: A collection of `CloseApproach`es.
     """
-    res = []
-    with open(cad_json_path, 'r') as f:
-        contents = json.load(f)
-        for d in contents['data']:
-            designation = d[0]
-            time = d[3]
-            distance = d[4]
-            velocity = d[7]
-            ca = CloseApproach(
-                designation=designation,
-                time=time,
-                distance=distance,
-                velocity=velocity
-            )
-            res.append(ca)
-    return tuple(res)
+    rows = map(itemgetter(0, 3, 4, 7), _read_json_data(cad_json_path))
+    return tuple(
+        CloseApproach(
+            designation=designation,
+            time=time,
+            distance=distance,
+            velocity=velocity
+        )
+        for designation, time, distance, velocity in rows
+    )
+
+
+def _read_json_data(json_path):
+    """Generate the entries of the "data" list of a JSON file.
+
+    `orjson` is preferred when it is installed. Otherwise, `ijson` streams the
+    entries one at a time so the whole document is never held in memory, and
+    the standard library `json` module is the last resort. Except when
+    streaming, the file is closed before the first entry is generated.
+
+    :param json_path: A path to a JSON file with a top-level "data" list.
+    :yield: Each entry of the "data" list.
+    """
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            contents = orjson.loads(f.read())
+    elif ijson is not None:
+        with open(json_path, 'rb') as f:
+            yield from ijson.items(f, 'data.item')
+        return
+    else:
+        with open(json_path, 'r') as f:
+            contents = json.load(f)
+    yield from contents['data']
@@ -15,6 +15,8 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
     def __init__(self, **info):
         """Create a new `NearEarthObject`.
 
@@ -78,6 +80,9 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'time', 'distance', 'velocity', 'neo',
+                 'ordinal')
+
     def __init__(self, **info):
         """Create a new `CloseApproach`.
 
@@ -88,6 +93,7 @@ class CloseApproach:
             else str(info['designation'])
         self.time = None if 'time' not in info\
             else cd_to_datetime(info['time'])
+        self.ordinal = None if self.time is None else self.time.toordinal()
         self.distance = 0.0 if 'distance' not in info\
             else float(info['distance'])
         self.velocity = 0.0 if 'velocity' not in info\
@@ -54,6 +54,11 @@ class TestDatabase(unittest.TestCase):
                     self.fail(f"{approach} appears in the approaches of multiple NEOs.")
                 seen.add(approach)
 
+    def test_database_construction_accepts_one_shot_iterables(self):
+        db = NEODatabase(iter(self.neos), iter(self.approaches))
+        self.assertEqual(set(db.query()), set(self.approaches))
+        self.assertIsNotNone(db.get_neo_by_designation('1865'))
+
     def test_get_neo_by_designation(self):
         cerberus = self.db.get_neo_by_designation('1865')
         self.assertIsNotNone(cerberus)
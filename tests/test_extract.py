@@ -14,8 +14,11 @@ import collections.abc
 import datetime
 import pathlib
 import math
+import tempfile
 import unittest
+import unittest.mock
 
+import extract
 from extract import load_neos, load_approaches
 from models import NearEarthObject, CloseApproach
 
@@ -77,6 +80,13 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.diameter, 0.6)
         self.assertEqual(neo.hazardous, True)
 
+    def test_neos_skip_blank_lines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / 'neos.csv'
+            path.write_text(TEST_NEO_FILE.read_text() + '\n')
+            neos = load_neos(path)
+        self.assertEqual(len(neos), 4226)
+
 
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
@@ -118,5 +128,31 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TestLoadApproachesParsers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.expected = cls.summarize(load_approaches(TEST_CAD_FILE))
+
+    @staticmethod
+    def summarize(approaches):
+        return [(approach.designation, approach.time,
+                 approach.distance, approach.velocity)
+                for approach in approaches]
+
+    @unittest.mock.patch('extract.ijson', None)
+    @unittest.mock.patch('extract.orjson', None)
+    def test_load_approaches_with_stdlib_json(self):
+        received = self.summarize(load_approaches(TEST_CAD_FILE))
+        self.assertEqual(len(received), 4700)
+        self.assertEqual(self.expected, received)
+
+    @unittest.skipUnless(extract.ijson, "ijson is not installed")
+    @unittest.mock.patch('extract.orjson', None)
+    def test_load_approaches_with_ijson(self):
+        received = self.summarize(load_approaches(TEST_CAD_FILE))
+        self.assertEqual(len(received), 4700)
+        self.assertEqual(self.expected, received)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,12 +13,15 @@ To run these tests from the project root, run::
 These tests should pass when Tasks 3a and 3b are complete.
 """
 import datetime
+import itertools
+import math
 import pathlib
 import unittest
 
-from database import NEODatabase
+from database import NEODatabase, _compile_terms
 from extract import load_neos, load_approaches
 from filters import create_filters
+from models import CloseApproach
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -528,6 +531,96 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    def test_query_ignores_unset_filters(self):
+        start_date = datetime.date(2020, 3, 1)
+        distance_max = 0.1
+
+        expected = set(
+            approach for approach in self.approaches
+            if start_date <= approach.time.date()
+            and approach.distance <= distance_max
+        )
+        self.assertGreater(len(expected), 0)
+
+        # The CLI passes every option, with `None` for those left unset.
+        filters = create_filters(
+            date=None, start_date=start_date, end_date=None,
+            distance_min=None, distance_max=distance_max,
+            velocity_min=None, velocity_max=None,
+            diameter_min=None, diameter_max=None,
+            hazardous=None
+        )
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_is_sorted_by_time(self):
+        filters = create_filters(start_date=datetime.date(2020, 3, 1),
+                                 velocity_min=10)
+        times = [approach.time for approach in self.db.query(filters)]
+        self.assertGreater(len(times), 0)
+        self.assertEqual(times, sorted(times))
+
+    def test_query_approach_without_time(self):
+        undated = CloseApproach(designation='2019 SC8', distance=0.01)
+        neos = load_neos(TEST_NEO_FILE)
+        approaches = load_approaches(TEST_CAD_FILE) + (undated,)
+        db = NEODatabase(neos, approaches)
+
+        self.assertIn(undated, set(db.query(create_filters())))
+        self.assertIn(undated, set(db.query(create_filters(distance_max=0.02))))
+        for filters in (create_filters(date=datetime.date(2020, 3, 2)),
+                        create_filters(end_date=datetime.date(2020, 6, 30)),
+                        create_filters(start_date=datetime.date(2020, 4, 1))):
+            self.assertNotIn(undated, set(db.query(filters)))
+
+
+class TestCompileTerms(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.neos = load_neos(TEST_NEO_FILE)
+        cls.approaches = load_approaches(TEST_CAD_FILE)
+        cls.db = NEODatabase(cls.neos, cls.approaches)
+
+    def test_terms_on_the_same_column_share_an_argument(self):
+        columns, match = _compile_terms([('_ap_distance', '>=', 0.01),
+                                         ('_ap_distance', '<=', 0.05)])
+        self.assertEqual(columns, ['_ap_distance'])
+        for distance in (0.0, 0.01, 0.03, 0.05, 0.06, math.nan):
+            self.assertEqual(match(distance), 0.01 <= distance <= 0.05)
+
+    def test_terms_on_hazard_and_missing_diameter(self):
+        columns, match = _compile_terms([('_ap_hazardous', '==', True),
+                                         ('_ap_diameter', '<=', 1.0)])
+        self.assertEqual(columns, ['_ap_hazardous', '_ap_diameter'])
+        for hazardous, diameter in itertools.product(
+                (-1, 0, 1), (0.5, 1.0, 1.5, math.nan)):
+            self.assertEqual(match(hazardous, diameter),
+                             hazardous == 1 and diameter <= 1.0)
+
+    def test_query_distance_range_matches_per_row_predicate(self):
+        expected = set(
+            approach for approach in self.approaches
+            if 0.01 <= approach.distance <= 0.05
+        )
+        self.assertGreater(len(expected), 0)
+
+        filters = create_filters(distance_min=0.01, distance_max=0.05)
+        received = set(self.db.query(filters))
+        self.assertEqual(expected, received)
+
+    def test_query_hazard_and_diameter_matches_per_row_predicate(self):
+        for hazardous in (True, False):
+            expected = set(
+                approach for approach in self.approaches
+                if approach.neo.hazardous == hazardous
+                and approach.neo.diameter <= 1.0
+            )
+            self.assertGreater(len(expected), 0)
+
+            filters = create_filters(hazardous=hazardous, diameter_max=1.0)
+            received = set(self.db.query(filters))
+            self.assertEqual(expected, received)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 import csv
 import json
+import math
 
 
 def write_to_csv(results, filename):
@@ -24,30 +25,24 @@ def write_to_csv(results, filename):
         'diameter_km',
         'potentially_hazardous'
     )
+    isnan = math.isnan
+
+    def row(r):
+        neo = r.neo
+        return (
+            r.time,
+            r.distance,
+            r.velocity,
+            r.designation,
+            neo.name or '',
+            '' if isnan(neo.diameter) else neo.diameter,
+            neo.hazardous
+        )
+
     with open(filename, 'w') as f:
         writer = csv.writer(f)
         writer.writerow(fieldnames)
-        for r in results:
-            datetime = r.time
-            distance = r.distance
-            velocity = r.velocity
-            designation = r.designation
-            name = '' if r.neo.name in ('', None)\
-                else r.neo.name
-            diameter = '' if r.neo.diameter in ('', 'nan')\
-                else r.neo.diameter
-            hazardous = True if r.neo.hazardous in (1, 'Y', 'True', True)\
-                else False
-            row = [
-                datetime,
-                distance,
-                velocity,
-                designation,
-                name,
-                diameter,
-                hazardous
-            ]
-            writer.writerow(row)
+        writer.writerows(map(row, results))
 
 
 def write_to_json(results, filename):
@@ -64,5 +59,9 @@ def write_to_json(results, filename):
     data should be saved.
     """
     with open(filename, 'w') as f:
-        res = [r.serialize() for r in results]
-        json.dump(res, f)
+        f.write('[')
+        for i, r in enumerate(results):
+            if i:
+                f.write(', ')
+            f.write(json.dumps(r.serialize()))
+        f.write(']')